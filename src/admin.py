@@ -42,6 +42,7 @@ from publication import (
     publication_venue_label,
 )
 from title_matching import normalize_title, summarize_author_list_for_display
+from utils import capture_stdout
 
 logger = logging.getLogger(__name__)
 
@@ -576,9 +577,9 @@ def retag_keyword(kid):
 def _refetch_arxiv_paper(arxiv_id):
     """Re-fetch a single paper from arXiv and return the fetch log."""
     from fetch_arxiv import fetch_by_arxiv_id
-    import io, contextlib
+    import io
     output = io.StringIO()
-    with contextlib.redirect_stdout(output):
+    with capture_stdout(output):
         fetch_by_arxiv_id(arxiv_id)
     return output.getvalue()
 
@@ -706,13 +707,13 @@ def fetch():
     result = None
 
     if request.method == 'POST':
-        import io, contextlib
+        import io
         mode      = request.form.get('mode', 'recent')
         from_date = request.form.get('from_date', '')
         to_date   = request.form.get('to_date',   today)
         buf = io.StringIO()
         try:
-            with contextlib.redirect_stdout(buf):
+            with capture_stdout(buf):
                 if mode == 'range' and from_date:
                     from fetch_arxiv import fetch_date_range
                     fetch_date_range(from_date, to_date)
@@ -1016,7 +1017,7 @@ def reject_doi(cid):
 @login_required
 def run_doi_lookup():
     """Trigger a small DOI lookup batch from the admin UI."""
-    import io, contextlib
+    import io
     try:
         from doi_lookup import main as doi_main
         buf = io.StringIO()
@@ -1027,7 +1028,7 @@ def run_doi_lookup():
             argv += ['--from-date', from_date]
         # Default: only papers up to end of 2023 (older papers more likely to have DOIs)
         argv += ['--to-date', to_date or '2023-12-31']
-        with contextlib.redirect_stdout(buf):
+        with capture_stdout(buf):
             doi_main(argv)
         return jsonify({'ok': True, 'log': buf.getvalue()})
     except Exception as e:
@@ -5,22 +5,29 @@ app.py - Flask web application for arXiv combinatorics frontend
 Main web interface for browsing arXiv papers.
 """
 
-from flask import Flask, render_template, request, jsonify, abort, redirect, url_for, session
+from flask import Flask, Response, render_template, request, jsonify, abort, redirect, url_for, session
 from urllib.parse import unquote, urlparse, urlencode
 import io
-import contextlib
+from collections import OrderedDict, deque
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import calendar
 import html
 import logging
 import random
 import re
+import threading
+import time
+import uuid
 import pymysql
 import requests
 from config import DB_CONFIG, FLASK_CONFIG, FETCH_SECRET, validate_config
-from db import get_db_connection, close_db_connection, get_paper_authors, attach_authors, attach_keywords
+from db import (get_db_connection, get_pooled_connection, close_db_connection,
+                fetch_paper_by_arxiv_id, attach_keywords, split_authors, AUTHORS_CONCAT_SQL)
 from datetime import datetime, date, timedelta
 from publication import publication_venue_label
-from utils import strip_accents, slugify, protect_capitals_for_bibtex, generate_bibtex_key, arxiv2bib
+from utils import (strip_accents, slugify, protect_capitals_for_bibtex, generate_bibtex_key, arxiv2bib,
+                   capture_stdout)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,6 +48,20 @@ app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(days=30)
 from werkzeug.middleware.proxy_fix import ProxyFix
 app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1, x_prefix=1)
 
+# An arXiv ID, DOI or URL fits comfortably; anything larger is not a lookup
+GENERATE_BIBTEX_MAX_BYTES = 4096
+
+@app.before_request
+def limit_generate_bibtex_body():
+    """Reject oversized /api/generate-bibtex bodies before anything parses them.
+
+    Registered ahead of CSRFProtect, whose hook reads request.form. Per-endpoint
+    rather than MAX_CONTENT_LENGTH, since admin and list forms post more.
+    """
+    if (request.endpoint == 'generate_bibtex_api'
+            and (request.content_length or 0) > GENERATE_BIBTEX_MAX_BYTES):
+        abort(413)
+
 from flask_wtf.csrf import CSRFProtect
 csrf = CSRFProtect(app)
 
@@ -238,6 +259,7 @@ _ARXIV_ID_PATTERNS = (
     re.compile(r'^\d{4}\.\d{4,5}(?:v\d+)?$', re.IGNORECASE),
     re.compile(r'^[a-z.-]+/\d{7}(?:v\d+)?$', re.IGNORECASE),
 )
+_DOI_PREFIX_RE = re.compile(r'10\.\d+/')
 
 
 def _extract_arxiv_id(value):
@@ -249,9 +271,10 @@ def _extract_arxiv_id(value):
     if not candidate:
         return None
 
-    if candidate.lower().startswith('arxiv:'):
+    lowered = candidate.lower()
+    if lowered.startswith('arxiv:'):
         candidate = candidate.split(':', 1)[1].strip()
-    elif candidate.lower().startswith(('arxiv.org/', 'www.arxiv.org/', 'export.arxiv.org/')):
+    elif lowered.startswith(('arxiv.org/', 'www.arxiv.org/', 'export.arxiv.org/')):
         candidate = 'https://' + candidate
     elif candidate.startswith('//'):
         candidate = 'https:' + candidate
@@ -313,23 +336,84 @@ def _resolve_paper_arxiv_id(cursor, value):
     return paper['arxiv_id'] if paper else None
 
 
+# ── Site stats cache ──────────────────────────────────────────────────────────
+# site_stats only changes when /fetch runs; keep a short-lived per-process copy
+# so listing pages don't re-read it on every request.
+SITE_STATS_TTL = 60  # seconds
+_site_stats_cache = {'stats': None, 'expires': 0.0}
+
+def get_site_stats(cursor):
+    """Return {total, total_authors, latest_date}, cached for SITE_STATS_TTL seconds."""
+    now = time.monotonic()
+    if _site_stats_cache['stats'] is not None and now < _site_stats_cache['expires']:
+        return _site_stats_cache['stats']
+
+    cursor.execute("SELECT paper_count, author_count, latest_date FROM site_stats WHERE id = 1")
+    row = cursor.fetchone()
+    if row:
+        stats = {'total': row['paper_count'], 'total_authors': row['author_count'],
+                 'latest_date': row['latest_date']}
+    else:
+        # No site_stats row yet: compute all three in a single round-trip
+        cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM papers)             AS total,
+                   (SELECT COUNT(*) FROM authors)            AS total_authors,
+                   (SELECT MAX(published_date) FROM papers) AS latest_date
+        """)
+        stats = cursor.fetchone()
+
+    _site_stats_cache['stats'] = stats
+    _site_stats_cache['expires'] = now + SITE_STATS_TTL
+    return stats
+
+_paper_id_bounds_cache = {'bounds': None, 'expires': 0.0}
+
+def get_paper_id_bounds(cursor):
+    """Return (min_id, max_id) of papers, or None if empty; cached like site stats."""
+    now = time.monotonic()
+    if _paper_id_bounds_cache['bounds'] is not None and now < _paper_id_bounds_cache['expires']:
+        return _paper_id_bounds_cache['bounds']
+    cursor.execute("SELECT MIN(id) as lo, MAX(id) as hi FROM papers")
+    row = cursor.fetchone()
+    bounds = (row['lo'], row['hi']) if row and row['lo'] else None
+    _paper_id_bounds_cache['bounds'] = bounds
+    _paper_id_bounds_cache['expires'] = now + SITE_STATS_TTL
+    return bounds
+
+def clear_site_stats_cache():
+    """Drop the cached site stats and id bounds. Call after data changes."""
+    _site_stats_cache['stats'] = None
+    _paper_id_bounds_cache['bounds'] = None
+
+
 # ── Index page data cache ─────────────────────────────────────────────────────
 # Pre-computed after each /fetch run; avoids DB queries for anonymous visitors.
 _index_cache = {}   # {page_num: {papers, page, total_pages, total, total_authors, latest_date}}
 
 def _build_index_page(cursor, page, per_page, stats):
-    """Query one page of papers and attach authors + keywords."""
+    """Query one page of papers and attach authors + keywords.
+
+    The OFFSET is applied to an id-only subquery that MariaDB can answer from
+    idx_published_date alone (InnoDB secondary indexes carry the primary key),
+    so deep pages skip index entries instead of reading and discarding full
+    rows with their abstracts. Only the final page of ids is joined back.
+    """
     offset = (page - 1) * per_page
-    cursor.execute("""
-        SELECT id, arxiv_id, title, abstract, published_date, updated_date,
-               journal_ref, doi, comment, primary_category,
-               publication_url, publication_venue_key, publication_status
-        FROM papers
-        ORDER BY published_date DESC, id DESC
-        LIMIT %s OFFSET %s
+    cursor.execute(f"""
+        SELECT p.id, p.arxiv_id, p.title, p.abstract, p.published_date, p.updated_date,
+               p.journal_ref, p.doi, p.comment, p.primary_category,
+               p.publication_url, p.publication_venue_key, p.publication_status,
+               {AUTHORS_CONCAT_SQL}
+        FROM (
+            SELECT id FROM papers
+            ORDER BY published_date DESC, id DESC
+            LIMIT %s OFFSET %s
+        ) AS page_ids
+        JOIN papers p ON p.id = page_ids.id
+        ORDER BY p.published_date DESC, p.id DESC
     """, (per_page, offset))
     papers = cursor.fetchall()
-    attach_authors(cursor, papers)
+    split_authors(papers)
     attach_keywords(cursor, papers)
     total_pages = max(1, (stats['total'] + per_page - 1) // per_page)
     return {
@@ -344,7 +428,7 @@ def _build_index_page(cursor, page, per_page, stats):
 def rebuild_index_cache():
     """Pre-warm the index cache for pages 1-2. Call after data changes."""
     global _index_cache
-    conn = pymysql.connect(**DB_CONFIG, cursorclass=pymysql.cursors.DictCursor)
+    conn = get_pooled_connection()
     cursor = conn.cursor()
     cursor.execute("SELECT paper_count, author_count, latest_date FROM site_stats WHERE id = 1")
     row = cursor.fetchone()
@@ -448,12 +532,21 @@ def _reformat_doi_bibtex(raw_bib, doi):
     return '\n'.join(lines)
 
 
+# Shared session so repeated doi.org lookups reuse TCP/TLS connections
+DOI_FETCH_WORKERS = 8
+# Lookups queued ahead of the entry being streamed in /api/author-bibtex
+DOI_FETCH_WINDOW = 2 * DOI_FETCH_WORKERS
+_doi_session = requests.Session()
+_doi_session.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=DOI_FETCH_WORKERS, pool_maxsize=DOI_FETCH_WORKERS))
+
+
 def _fetch_doi_bibtex(doi):
     """Fetch DOI BibTeX from doi.org and reformat it to match our style."""
     try:
         doi_url = f"https://doi.org/{doi}"
         headers = {'Accept': 'application/x-bibtex'}
-        response = requests.get(doi_url, headers=headers, timeout=10)
+        response = _doi_session.get(doi_url, headers=headers, timeout=10)
         response.raise_for_status()
         raw = response.text.strip()
         if not raw or '@' not in raw[:50]:
@@ -556,13 +649,28 @@ def ensure_author_slugs():
             cursor.execute("CREATE INDEX idx_author_slug ON authors(slug)")
             conn.commit()
 
-        # Populate missing slugs
+        # Populate missing slugs. PyMySQL folds executemany() INSERTs into
+        # multi-row statements, so stage the slugs in a temp table and apply
+        # them with one UPDATE instead of one round-trip per author.
         cursor.execute("SELECT id, name FROM authors WHERE slug IS NULL")
         authors = cursor.fetchall()
         if authors:
-            for author in authors:
-                cursor.execute("UPDATE authors SET slug = %s WHERE id = %s",
-                               (slugify(author['name']), author['id']))
+            cursor.execute("""
+                CREATE TEMPORARY TABLE tmp_author_slugs (
+                    id   INT NOT NULL PRIMARY KEY,
+                    slug VARCHAR(255)
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """)
+            cursor.executemany(
+                "INSERT INTO tmp_author_slugs (id, slug) VALUES (%s, %s)",
+                [(author['id'], slugify(author['name'])) for author in authors]
+            )
+            cursor.execute("""
+                UPDATE authors a
+                JOIN tmp_author_slugs t ON a.id = t.id
+                SET a.slug = t.slug
+            """)
+            cursor.execute("DROP TEMPORARY TABLE tmp_author_slugs")
             conn.commit()
     finally:
         cursor.close()
@@ -624,51 +732,12 @@ def index():
         cached = _index_cache[page]
         return render_template('index.html', **cached)
 
-    offset = (page - 1) * per_page
-
     conn = get_db_connection()
     cursor = conn.cursor()
-
-    cursor.execute("SELECT paper_count, author_count, latest_date FROM site_stats WHERE id = 1")
-    stats = cursor.fetchone()
-    if stats:
-        total        = stats['paper_count']
-        total_authors = stats['author_count']
-        latest_date  = stats['latest_date']
-    else:
-        cursor.execute("SELECT COUNT(*) as count FROM papers")
-        total = cursor.fetchone()['count']
-        cursor.execute("SELECT COUNT(*) as count FROM authors")
-        total_authors = cursor.fetchone()['count']
-        cursor.execute("SELECT MAX(published_date) as latest FROM papers")
-        latest_date = cursor.fetchone()['latest']
-
-    # Get papers for current page
-    cursor.execute("""
-        SELECT id, arxiv_id, title, abstract, published_date, updated_date,
-               journal_ref, doi, comment, primary_category,
-               publication_url, publication_venue_key, publication_status
-        FROM papers
-        ORDER BY published_date DESC, id DESC
-        LIMIT %s OFFSET %s
-    """, (per_page, offset))
-
-    papers = cursor.fetchall()
-
-    attach_authors(cursor, papers)
-    attach_keywords(cursor, papers)
-
+    data = _build_index_page(cursor, page, per_page, get_site_stats(cursor))
     cursor.close()
 
-    total_pages = (total + per_page - 1) // per_page
-
-    return render_template('index.html',
-                         papers=papers,
-                         page=page,
-                         total_pages=total_pages,
-                         total=total,
-                         total_authors=total_authors,
-                         latest_date=latest_date)
+    return render_template('index.html', **data)
 
 
 @app.route('/paper/<path:arxiv_id>')
@@ -677,16 +746,12 @@ def paper_detail(arxiv_id):
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    cursor.execute("""
-        SELECT id, arxiv_id, title, abstract, published_date, updated_date,
-               comment, journal_ref, doi, doi_status, primary_category,
-               publication_url, publication_venue_key, publication_status,
-               editor_note
-        FROM papers
-        WHERE arxiv_id = %s
-    """, (arxiv_id,))
-
-    paper = cursor.fetchone()
+    paper = fetch_paper_by_arxiv_id(cursor, arxiv_id, """
+        p.id, p.arxiv_id, p.title, p.abstract, p.published_date, p.updated_date,
+        p.comment, p.journal_ref, p.doi, p.doi_status, p.primary_category,
+        p.publication_url, p.publication_venue_key, p.publication_status,
+        p.editor_note
+    """)
 
     if not paper:
         canonical_id = _resolve_paper_arxiv_id(cursor, arxiv_id)
@@ -695,8 +760,6 @@ def paper_detail(arxiv_id):
             return redirect(url_for('paper_detail', arxiv_id=canonical_id))
         abort(404)
 
-    paper['authors'] = get_paper_authors(cursor, paper['id'])
-
     cursor.execute("""
         SELECT k.phrase, k.score, k.url
         FROM paper_keywords pk
@@ -717,28 +780,132 @@ def paper_detail(arxiv_id):
     return render_template('paper.html', paper=paper)
 
 
-@app.route('/api/bibtex/<path:arxiv_id>')
-def bibtex(arxiv_id):
-    """Generate arXiv BibTeX entry for a paper."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+# ── BibTeX HTTP caching ───────────────────────────────────────────────────────
+# Citation managers re-poll the BibTeX endpoints; an ETag derived from the
+# row's updated_at lets repeat requests get a 304 before any formatting or
+# doi.org lookup happens.
+BIBTEX_MAX_AGE = 86400  # seconds
+# Entries built from local metadata because doi.org failed: no ETag, and only
+# briefly cacheable, so the real entry replaces it once doi.org answers again
+BIBTEX_FALLBACK_MAX_AGE = 300  # seconds
+
+# Paper columns needed to render a BibTeX entry (authors come inline)
+_BIBTEX_COLUMNS = "p.id, p.arxiv_id, p.title, p.published_date, p.journal_ref, p.doi, p.updated_at"
+
+# Rendered bodies keyed by ETag. The ETag already encodes the row version, so
+# an edited paper simply misses; entries are also dropped after each /fetch.
+BIBTEX_CACHE_SIZE = 4096
+# Streamed author bodies are only kept if they stay under this size, so the
+# cache never pins a second copy of a prolific author's full list
+BIBTEX_AUTHOR_CACHE_MAX_BYTES = 64 * 1024
+_bibtex_body_cache = OrderedDict()   # {etag: body}, least recently used first
+_bibtex_body_lock = threading.Lock()
+
+def _bibtex_etag(*parts):
+    """Return a short strong ETag for the given identifying values."""
+    return hashlib.blake2s(':'.join(str(p) for p in parts).encode()).hexdigest()[:16]
 
+
+def _bibtex_response(body, etag, status=200):
+    """Return a plain-text BibTeX response with caching headers.
+
+    Pass etag=None for a body that must not be pinned by clients (fallback
+    entries); it is sent without an ETag and with a short max-age.
+    """
+    resp = Response(body, status, content_type='text/plain; charset=utf-8')
+    resp.cache_control.public = True
+    if etag is None:
+        resp.cache_control.max_age = BIBTEX_FALLBACK_MAX_AGE
+    else:
+        resp.set_etag(etag)
+        resp.cache_control.max_age = BIBTEX_MAX_AGE
+    return resp
+
+
+def _bibtex_not_modified(etag):
+    """Return a 304 response if the client already holds this ETag, else None."""
+    # If-None-Match uses weak comparison (RFC 7232 §3.2), so W/ tags match too
+    if request.if_none_match.contains_weak(etag):
+        return _bibtex_response('', etag, status=304)
+    return None
+
+
+def _get_cached_bibtex(etag):
+    """Return the cached BibTeX body for this ETag, or None."""
+    with _bibtex_body_lock:
+        body = _bibtex_body_cache.get(etag)
+        if body is not None:
+            _bibtex_body_cache.move_to_end(etag)
+        return body
+
+
+def _put_cached_bibtex(etag, body):
+    """Remember a rendered body. Only pass complete, authoritative renders."""
+    if not body:
+        return
+    with _bibtex_body_lock:
+        _bibtex_body_cache[etag] = body
+        _bibtex_body_cache.move_to_end(etag)
+        while len(_bibtex_body_cache) > BIBTEX_CACHE_SIZE:
+            _bibtex_body_cache.popitem(last=False)
+
+
+def clear_bibtex_cache():
+    """Drop all cached BibTeX bodies. Call after data changes."""
+    with _bibtex_body_lock:
+        _bibtex_body_cache.clear()
+
+
+def _doi_bibtex_or_fallback(doi, paper):
+    """Return (bibtex, from_doi_org): doi.org's entry, else one from local metadata."""
+    bibtex = _fetch_doi_bibtex(doi)
+    if bibtex:
+        return bibtex, True
+    return _custom_doi_bibtex(doi, paper), False
+
+
+def _paper_bibtex_version(cursor, arxiv_id):
+    """Return the id/doi/publication_url/updated_at of a paper, or None.
+
+    Cheap lookup used to build the ETag before deciding whether the full
+    row and author list are needed at all.
+    """
     cursor.execute("""
-        SELECT id, arxiv_id, title, published_date, journal_ref, doi
+        SELECT id, doi, publication_url, updated_at
         FROM papers
         WHERE arxiv_id = %s
     """, (arxiv_id,))
+    return cursor.fetchone()
 
-    paper = cursor.fetchone()
 
-    if not paper:
+@app.route('/api/bibtex/<path:arxiv_id>')
+def bibtex(arxiv_id):
+    """Generate arXiv BibTeX entry for a paper."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    version = _paper_bibtex_version(cursor, arxiv_id)
+    if not version:
+        cursor.close()
         abort(404)
 
-    paper['authors'] = get_paper_authors(cursor, paper['id'])
+    etag = _bibtex_etag('arxiv', version['id'], version['updated_at'])
+    not_modified = _bibtex_not_modified(etag)
+    if not_modified:
+        cursor.close()
+        return not_modified
+
+    bibtex = _get_cached_bibtex(etag)
+    if bibtex is None:
+        paper = fetch_paper_by_arxiv_id(cursor, arxiv_id, _BIBTEX_COLUMNS)
+        if not paper:
+            cursor.close()
+            abort(404)
+        bibtex = arxiv2bib(paper)
+        _put_cached_bibtex(etag, bibtex)
     cursor.close()
 
-    bibtex = arxiv2bib(paper)
-    return bibtex, 200, {'Content-Type': 'text/plain; charset=utf-8'}
+    return _bibtex_response(bibtex, etag)
 
 
 @app.route('/api/doi-bibtex/<path:arxiv_id>')
@@ -747,25 +914,33 @@ def doi_bibtex(arxiv_id):
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    cursor.execute("""
-        SELECT id, arxiv_id, title, published_date, journal_ref, doi
-        FROM papers
-        WHERE arxiv_id = %s
-    """, (arxiv_id,))
-
-    paper = cursor.fetchone()
-
-    if not paper or not paper['doi']:
+    version = _paper_bibtex_version(cursor, arxiv_id)
+    if not version or not version['doi']:
+        cursor.close()
         abort(404)
 
-    paper['authors'] = get_paper_authors(cursor, paper['id'])
-    cursor.close()
+    etag = _bibtex_etag('doi', version['id'], version['updated_at'])
+    not_modified = _bibtex_not_modified(etag)
+    if not_modified:
+        cursor.close()
+        return not_modified
 
-    bibtex = published_doi_bibtex(paper['doi'], paper)
-    if bibtex:
-        return bibtex, 200, {'Content-Type': 'text/plain; charset=utf-8'}
+    bibtex = _get_cached_bibtex(etag)
+    if bibtex is None:
+        paper = fetch_paper_by_arxiv_id(cursor, arxiv_id, _BIBTEX_COLUMNS)
+        cursor.close()
+        if not paper or not paper['doi']:
+            abort(404)
+        # Release the connection before the doi.org round-trip
+        close_db_connection()
+        bibtex, from_doi_org = _doi_bibtex_or_fallback(paper['doi'], paper)
+        if not from_doi_org:
+            return _bibtex_response(bibtex, None)
+        _put_cached_bibtex(etag, bibtex)
     else:
-        return "Error generating DOI BibTeX", 500, {'Content-Type': 'text/plain; charset=utf-8'}
+        cursor.close()
+
+    return _bibtex_response(bibtex, etag)
 
 
 @app.route('/api/publication-bibtex/<path:arxiv_id>')
@@ -774,28 +949,37 @@ def publication_bibtex(arxiv_id):
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    cursor.execute("""
-        SELECT id, arxiv_id, title, published_date, journal_ref, doi,
-               publication_url, publication_venue_key, publication_status
-        FROM papers
-        WHERE arxiv_id = %s
-    """, (arxiv_id,))
-
-    paper = cursor.fetchone()
-
-    if not paper or (not paper['doi'] and not paper['publication_url']):
+    version = _paper_bibtex_version(cursor, arxiv_id)
+    if not version or (not version['doi'] and not version['publication_url']):
+        cursor.close()
         abort(404)
 
-    paper['authors'] = get_paper_authors(cursor, paper['id'])
-    cursor.close()
+    etag = _bibtex_etag('publication', version['id'], version['updated_at'])
+    not_modified = _bibtex_not_modified(etag)
+    if not_modified:
+        cursor.close()
+        return not_modified
 
-    if paper['doi']:
-        bibtex = published_doi_bibtex(paper['doi'], paper)
+    bibtex = _get_cached_bibtex(etag)
+    if bibtex is None:
+        paper = fetch_paper_by_arxiv_id(cursor, arxiv_id, _BIBTEX_COLUMNS + """,
+            p.publication_url, p.publication_venue_key, p.publication_status
+        """)
+        cursor.close()
+        if not paper or (not paper['doi'] and not paper['publication_url']):
+            abort(404)
+        if paper['doi']:
+            close_db_connection()
+            bibtex, from_doi_org = _doi_bibtex_or_fallback(paper['doi'], paper)
+            if not from_doi_org:
+                return _bibtex_response(bibtex, None)
+        else:
+            bibtex = _custom_publication_bibtex(paper)
+        _put_cached_bibtex(etag, bibtex)
     else:
-        bibtex = _custom_publication_bibtex(paper)
-    if bibtex:
-        return bibtex, 200, {'Content-Type': 'text/plain; charset=utf-8'}
-    return "Error generating publication BibTeX", 500, {'Content-Type': 'text/plain; charset=utf-8'}
+        cursor.close()
+
+    return _bibtex_response(bibtex, etag)
 
 
 @app.route('/tools')
@@ -912,9 +1096,11 @@ def _generate_bibtex(input_text, lookup_doi=False):
     doi = None
 
     if not arxiv_id:
-        if 'doi.org/' in input_text.lower():
-            doi = input_text.split('doi.org/')[-1]
-        elif re.match(r'^10\.\d+/', input_text):
+        # Checked in priority order; stop at the first that applies
+        pos = input_text.lower().rfind('doi.org/')
+        if pos != -1:
+            doi = input_text[pos + len('doi.org/'):]
+        elif _DOI_PREFIX_RE.match(input_text):
             doi = input_text
 
     if arxiv_id:
@@ -924,15 +1110,9 @@ def _generate_bibtex(input_text, lookup_doi=False):
         paper = None
         canonical_id = _resolve_paper_arxiv_id(cursor, arxiv_id)
         if canonical_id:
-            cursor.execute("""
-                SELECT id, arxiv_id, title, published_date, journal_ref, doi
-                FROM papers
-                WHERE arxiv_id = %s
-            """, (canonical_id,))
-            paper = cursor.fetchone()
+            paper = fetch_paper_by_arxiv_id(cursor, canonical_id, _BIBTEX_COLUMNS)
 
         if paper:
-            paper['authors'] = get_paper_authors(cursor, paper['id'])
             cursor.close()
             result = {'arxiv': arxiv2bib(paper)}
             paper_doi = paper['doi']
@@ -1005,10 +1185,15 @@ def _generate_bibtex(input_text, lookup_doi=False):
 
 @app.route('/api/generate-bibtex', methods=['POST'])
 def generate_bibtex_api():
-    """POST endpoint for the tools page (requires CSRF)."""
-    data = request.get_json()
+    """POST endpoint for the tools page (requires CSRF).
+
+    Accepts a JSON body, or plain form fields so HTML forms can post directly.
+    """
+    data = request.get_json(silent=True) or request.form or request.args
     lookup = data.get('lookup_doi', False)
-    result, status = _generate_bibtex(data.get('input', '').strip(),
+    if isinstance(lookup, str):
+        lookup = lookup.lower() in ('1', 'true', 'on', 'yes')
+    result, status = _generate_bibtex((data.get('input') or '').strip(),
                                       lookup_doi=bool(lookup))
     return jsonify(result), status
 
@@ -1043,27 +1228,25 @@ def _search_author_terms(query):
     return terms
 
 
-def _author_search_condition(author_terms):
-    """Build SQL requiring every term to appear among a paper's authors."""
+def _author_match_sql(author_terms):
+    """Build SQL selecting (id, 1 AS author_match) for papers whose authors
+    contain every term (each term may match a different author)."""
     if not author_terms:
-        return "0 = 1", []
+        return None, []
 
-    having = []
-    params = []
-    for term in author_terms:
-        having.append("SUM(CASE WHEN LOWER(a.name) LIKE %s THEN 1 ELSE 0 END) > 0")
-        params.append(f"%{term}%")
+    patterns = [f"%{term}%" for term in author_terms]
+    any_term = ' OR '.join(["LOWER(a.name) LIKE %s"] * len(author_terms))
+    every_term = ' AND '.join(
+        ["SUM(CASE WHEN LOWER(a.name) LIKE %s THEN 1 ELSE 0 END) > 0"] * len(author_terms))
 
     return f"""
-        EXISTS (
-            SELECT 1
-            FROM paper_authors pa
-            JOIN authors a ON pa.author_id = a.id
-            WHERE pa.paper_id = p.id
-            GROUP BY pa.paper_id
-            HAVING {' AND '.join(having)}
-        )
-    """, params
+        SELECT pa.paper_id AS id, 1 AS author_match
+        FROM authors a
+        JOIN paper_authors pa ON pa.author_id = a.id
+        WHERE {any_term}
+        GROUP BY pa.paper_id
+        HAVING {every_term}
+    """, patterns + patterns
 
 
 def _cors_json(payload, status=200, max_age=3600):
@@ -1184,9 +1367,7 @@ def search():
         return redirect(url_for('keyword_papers', phrase=keyword['phrase']))
 
     # 4. Full-text / LIKE search on titles and abstracts
-    cursor.execute("SELECT latest_date FROM site_stats WHERE id = 1")
-    row = cursor.fetchone()
-    latest_date = row['latest_date'] if row else None
+    latest_date = get_site_stats(cursor)['latest_date']
 
     kw_subquery = """
         (SELECT pk.paper_id, COALESCE(SUM(k.score), 0) AS kw_score
@@ -1201,67 +1382,71 @@ def search():
 
     words = query.split()
     use_fulltext = all(len(w) >= 3 for w in words) and len(words) > 0
-    author_condition, author_params = _author_search_condition(
-        _search_author_terms(query))
-
     if use_fulltext:
         ft_query = '+' + ' +'.join(words)  # boolean mode: require all words
-
-        cursor.execute(f"""
-            SELECT COUNT(DISTINCT p.id) as count
-            FROM papers p
-            WHERE MATCH(p.title, p.abstract) AGAINST(%s IN BOOLEAN MODE)
-               OR {author_condition}
-        """, [ft_query] + author_params)
-        total = cursor.fetchone()['count']
-
-        cursor.execute(f"""
-            SELECT p.id, p.arxiv_id, p.title, p.abstract,
-                   p.published_date, p.updated_date, p.journal_ref, p.doi,
-                   p.publication_url, p.publication_venue_key, p.publication_status,
-                   p.comment, p.primary_category,
-                   ({author_condition}) AS author_match,
-                   MATCH(p.title, p.abstract) AGAINST(%s IN BOOLEAN MODE) AS text_score,
-                   COALESCE(kw.kw_score, 0) AS kw_score
-            FROM papers p
-            LEFT JOIN {kw_subquery} ON p.id = kw.paper_id
-            WHERE MATCH(p.title, p.abstract) AGAINST(%s IN BOOLEAN MODE)
-               OR {author_condition}
-            ORDER BY {order_clause}
-            LIMIT %s OFFSET %s
-        """, author_params + [ft_query, ft_query] + author_params + [per_page, offset])
+        text_match_sql = """
+            SELECT id, 0 AS author_match FROM papers
+            WHERE MATCH(title, abstract) AGAINST(%s IN BOOLEAN MODE)
+        """
+        text_params = [ft_query]
+        score_sql = "MATCH(p.title, p.abstract) AGAINST(%s IN BOOLEAN MODE)"
+        score_params = [ft_query]
     else:
         like_term = f"%{query}%"
+        text_match_sql = """
+            SELECT id, 0 AS author_match FROM papers
+            WHERE title LIKE %s OR abstract LIKE %s
+        """
+        text_params = [like_term, like_term]
+        score_sql = """
+            CASE
+                WHEN p.title LIKE %s THEN 2
+                WHEN p.abstract LIKE %s THEN 1
+                ELSE 0
+            END"""
+        score_params = [like_term, like_term]
+
+    # Text and author matches are separate UNION branches so each can use its
+    # own index (FULLTEXT / idx_author_id); an OR in one WHERE forces a scan.
+    author_match_sql, author_params = _author_match_sql(_search_author_terms(query))
+    branches = [text_match_sql] + ([author_match_sql] if author_match_sql else [])
+    matches_sql = f"""
+        SELECT id, MAX(author_match) AS author_match
+        FROM ({' UNION ALL '.join(branches)}) u
+        GROUP BY id
+    """
+    match_params = text_params + author_params
 
-        cursor.execute(f"""
-            SELECT COUNT(DISTINCT p.id) as count FROM papers p
-            WHERE p.title LIKE %s OR p.abstract LIKE %s
-               OR {author_condition}
-        """, [like_term, like_term] + author_params)
-        total = cursor.fetchone()['count']
+    # COUNT(*) OVER () returns the total match count alongside the page rows,
+    # saving a separate COUNT round-trip.
+    cursor.execute(f"""
+        SELECT p.id, p.arxiv_id, p.title, p.abstract,
+               p.published_date, p.updated_date, p.journal_ref, p.doi,
+               p.publication_url, p.publication_venue_key, p.publication_status,
+               p.comment, p.primary_category,
+               m.author_match,
+               {score_sql} AS text_score,
+               COALESCE(kw.kw_score, 0) AS kw_score,
+               COUNT(*) OVER () AS total_count,
+               {AUTHORS_CONCAT_SQL}
+        FROM ({matches_sql}) m
+        JOIN papers p ON p.id = m.id
+        LEFT JOIN {kw_subquery} ON p.id = kw.paper_id
+        ORDER BY {order_clause}
+        LIMIT %s OFFSET %s
+    """, score_params + match_params + [per_page, offset])
+    papers = cursor.fetchall()
 
-        cursor.execute(f"""
-            SELECT p.id, p.arxiv_id, p.title, p.abstract,
-                   p.published_date, p.updated_date, p.journal_ref, p.doi,
-                   p.publication_url, p.publication_venue_key, p.publication_status,
-                   p.comment, p.primary_category,
-                   ({author_condition}) AS author_match,
-                   CASE
-                       WHEN p.title LIKE %s THEN 2
-                       WHEN p.abstract LIKE %s THEN 1
-                       ELSE 0
-                   END AS text_score,
-                   COALESCE(kw.kw_score, 0) AS kw_score
-            FROM papers p
-            LEFT JOIN {kw_subquery} ON p.id = kw.paper_id
-            WHERE p.title LIKE %s OR p.abstract LIKE %s
-               OR {author_condition}
-            ORDER BY {order_clause}
-            LIMIT %s OFFSET %s
-        """, author_params + [like_term, like_term, like_term, like_term] + author_params + [per_page, offset])
+    if papers:
+        total = papers[0]['total_count']
+    elif offset == 0:
+        total = 0   # an empty first page means no matches at all
+    else:
+        # Past the last page: count separately for pagination
+        cursor.execute(f"SELECT COUNT(*) as count FROM ({matches_sql}) m", match_params)
+        total = cursor.fetchone()['count']
 
-    papers = cursor.fetchall()
-    attach_authors(cursor, papers)
+    split_authors(papers)
     attach_keywords(cursor, papers)
 
     cursor.close()
@@ -1299,11 +1484,12 @@ def keyword_papers(phrase):
     """, (keyword['id'],))
     total = cursor.fetchone()['count']
 
-    cursor.execute("""
+    cursor.execute(f"""
         SELECT p.id, p.arxiv_id, p.title, p.abstract,
                p.published_date, p.updated_date, p.journal_ref, p.doi,
                p.publication_url, p.publication_venue_key, p.publication_status,
-               p.comment, p.primary_category
+               p.comment, p.primary_category,
+               {AUTHORS_CONCAT_SQL}
         FROM paper_keywords pk
         JOIN papers p ON pk.paper_id = p.id
         WHERE pk.keyword_id = %s
@@ -1312,7 +1498,7 @@ def keyword_papers(phrase):
     """, (keyword['id'], per_page, offset))
     papers = cursor.fetchall()
 
-    attach_authors(cursor, papers)
+    split_authors(papers)
     attach_keywords(cursor, papers)
 
     # Watch state
@@ -1401,11 +1587,12 @@ def category_papers(cat):
     if not total:
         abort(404)
 
-    cursor.execute("""
+    cursor.execute(f"""
         SELECT p.id, p.arxiv_id, p.title, p.abstract,
                p.published_date, p.updated_date, p.journal_ref, p.doi,
                p.publication_url, p.publication_venue_key, p.publication_status,
-               p.comment, p.primary_category
+               p.comment, p.primary_category,
+               {AUTHORS_CONCAT_SQL}
         FROM paper_categories pc
         JOIN papers p ON pc.paper_id = p.id
         WHERE pc.category = %s
@@ -1414,7 +1601,7 @@ def category_papers(cat):
     """, (cat, per_page, offset))
     papers = cursor.fetchall()
 
-    attach_authors(cursor, papers)
+    split_authors(papers)
     attach_keywords(cursor, papers)
 
     cursor.close()
@@ -1452,25 +1639,16 @@ def author_papers(author_slug):
     if author.get('slug') and author_slug != author['slug']:
         return redirect(url_for('author_papers', author_slug=author['slug'], page=page), code=301)
 
-    # Get latest published date
-    cursor.execute("SELECT MAX(published_date) as latest FROM papers")
-    latest_date = cursor.fetchone()['latest']
-
-    # Get total count
-    cursor.execute("""
-        SELECT COUNT(*) as count
-        FROM papers p
-        JOIN paper_authors pa ON p.id = pa.paper_id
-        WHERE pa.author_id = %s
-    """, (author['id'],))
-    total = cursor.fetchone()['count']
+    latest_date = get_site_stats(cursor)['latest_date']
 
-    # Get papers
-    cursor.execute("""
+    # Get papers, with the author's total paper count in the same round-trip
+    cursor.execute(f"""
         SELECT p.id, p.arxiv_id, p.title, p.abstract,
                p.published_date, p.updated_date, p.journal_ref, p.doi,
                p.publication_url, p.publication_venue_key, p.publication_status,
-               p.comment, p.primary_category
+               p.comment, p.primary_category,
+               COUNT(*) OVER () AS total_count,
+               {AUTHORS_CONCAT_SQL}
         FROM papers p
         JOIN paper_authors pa ON p.id = pa.paper_id
         WHERE pa.author_id = %s
@@ -1480,7 +1658,19 @@ def author_papers(author_slug):
 
     papers = cursor.fetchall()
 
-    attach_authors(cursor, papers)
+    if papers:
+        total = papers[0]['total_count']
+    elif offset == 0:
+        total = 0
+    else:
+        # Past the last page: count separately for pagination
+        cursor.execute(
+            "SELECT COUNT(*) as count FROM paper_authors WHERE author_id = %s",
+            (author['id'],)
+        )
+        total = cursor.fetchone()['count']
+
+    split_authors(papers)
     attach_keywords(cursor, papers)
 
     # Watch state
@@ -1507,23 +1697,47 @@ def author_papers(author_slug):
                          watching=watching)
 
 
+# ── Browse calendar cache ─────────────────────────────────────────────────────
+# The calendar for a year is the same for every visitor until papers land, so
+# keep the built month grids per year. Cleared after each /fetch.
+BROWSE_CACHE_TTL = 600  # seconds
+_browse_cache = {}   # {year: {month_data, available_years, expires}}
+
+
+def clear_browse_cache():
+    """Drop all cached browse calendars. Call after data changes."""
+    _browse_cache.clear()
+
+
 @app.route('/browse')
 def browse_by_date():
     """Browse papers by calendar date."""
     year = request.args.get('year', datetime.now().year, type=int)
+    if not 1 <= year < 9999:
+        abort(404)
+
+    cached = _browse_cache.get(year)
+    if cached and time.monotonic() < cached['expires']:
+        return render_template('browse.html',
+                             year=year,
+                             month_data=cached['month_data'],
+                             available_years=cached['available_years'])
 
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    # Get paper counts by date for the year
+    # Get paper counts per day of the year, indexed by day-of-year (1..366).
+    # A date range (not YEAR()) lets MariaDB use idx_published_date.
     cursor.execute("""
-        SELECT DATE(published_date) as date, COUNT(*) as count
+        SELECT DAYOFYEAR(published_date) as doy, COUNT(*) as count
         FROM papers
-        WHERE YEAR(published_date) = %s
-        GROUP BY DATE(published_date)
-    """, (year,))
+        WHERE published_date >= %s AND published_date < %s
+        GROUP BY doy
+    """, (date(year, 1, 1), date(year + 1, 1, 1)))
 
-    date_counts = {row['date']: row['count'] for row in cursor.fetchall()}
+    day_counts = [0] * 367
+    for row in cursor.fetchall():
+        day_counts[row['doy']] = row['count']
 
     # Get available years with paper counts
     cursor.execute("""
@@ -1543,17 +1757,16 @@ def browse_by_date():
 
     for month in range(1, 13):
         cal = calendar.monthcalendar(year, month)
+        month_start = date(year, month, 1).timetuple().tm_yday - 1
         days = []
         for week in cal:
             for day in week:
                 if day == 0:
                     days.append({'day': 0, 'count': 0})
                 else:
-                    date_obj = date(year, month, day)
-                    count = date_counts.get(date_obj, 0)
                     days.append({
                         'day': day,
-                        'count': count,
+                        'count': day_counts[month_start + day],
                         'date_str': f"{year:04d}-{month:02d}-{day:02d}"
                     })
 
@@ -1562,6 +1775,14 @@ def browse_by_date():
             'days': days
         })
 
+    # Only years that have papers, so arbitrary ?year= values can't grow the cache
+    if any(y == year for y, _ in available_years):
+        _browse_cache[year] = {
+            'month_data': month_data,
+            'available_years': available_years,
+            'expires': time.monotonic() + BROWSE_CACHE_TTL,
+        }
+
     return render_template('browse.html',
                          year=year,
                          month_data=month_data,
@@ -1579,18 +1800,19 @@ def papers_by_date(date_str):
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    cursor.execute("""
-        SELECT id, arxiv_id, title, abstract, published_date, updated_date,
-               journal_ref, doi, comment, primary_category,
-               publication_url, publication_venue_key, publication_status
-        FROM papers
-        WHERE DATE(published_date) = %s
-        ORDER BY id DESC
+    cursor.execute(f"""
+        SELECT p.id, p.arxiv_id, p.title, p.abstract, p.published_date, p.updated_date,
+               p.journal_ref, p.doi, p.comment, p.primary_category,
+               p.publication_url, p.publication_venue_key, p.publication_status,
+               {AUTHORS_CONCAT_SQL}
+        FROM papers p
+        WHERE DATE(p.published_date) = %s
+        ORDER BY p.id DESC
     """, (date,))
 
     papers = cursor.fetchall()
 
-    attach_authors(cursor, papers)
+    split_authors(papers)
     attach_keywords(cursor, papers)
 
     cursor.close()
@@ -1605,13 +1827,18 @@ def random_paper():
     """Redirect to a random paper."""
     conn = get_db_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT MIN(id) as lo, MAX(id) as hi FROM papers")
-    bounds = cursor.fetchone()
-    if not bounds or not bounds['lo']:
+    bounds = get_paper_id_bounds(cursor)
+    if not bounds:
+        cursor.close()
         abort(404)
-    rand_id = random.randint(bounds['lo'], bounds['hi'])
-    cursor.execute("SELECT arxiv_id FROM papers WHERE id >= %s LIMIT 1", (rand_id,))
-    paper = cursor.fetchone()
+    # Primary-key seek; retry in case the cached max id has since been deleted
+    paper = None
+    for _ in range(5):
+        rand_id = random.randint(*bounds)
+        cursor.execute("SELECT arxiv_id FROM papers WHERE id >= %s ORDER BY id LIMIT 1", (rand_id,))
+        paper = cursor.fetchone()
+        if paper:
+            break
     cursor.close()
     if not paper:
         abort(404)
@@ -1632,8 +1859,28 @@ def author_bibtex(author_slug):
     if not author:
         abort(404)
 
+    # Paper count catches removals that MAX(updated_at) alone would miss
     cursor.execute("""
-        SELECT p.id, p.arxiv_id, p.title, p.published_date, p.journal_ref, p.doi
+        SELECT COUNT(*) AS paper_count, MAX(p.updated_at) AS last_updated
+        FROM papers p
+        JOIN paper_authors pa ON p.id = pa.paper_id
+        WHERE pa.author_id = %s
+    """, (author['id'],))
+    version = cursor.fetchone()
+    etag = _bibtex_etag('author', author['id'], version['paper_count'], version['last_updated'])
+    not_modified = _bibtex_not_modified(etag)
+    if not_modified:
+        cursor.close()
+        return not_modified
+
+    cached = _get_cached_bibtex(etag)
+    if cached is not None:
+        cursor.close()
+        return _bibtex_response(cached, etag)
+
+    cursor.execute(f"""
+        SELECT p.id, p.arxiv_id, p.title, p.published_date, p.journal_ref, p.doi,
+               {AUTHORS_CONCAT_SQL}
         FROM papers p
         JOIN paper_authors pa ON p.id = pa.paper_id
         WHERE pa.author_id = %s
@@ -1641,62 +1888,165 @@ def author_bibtex(author_slug):
     """, (author['id'],))
 
     papers = cursor.fetchall()
-    attach_authors(cursor, papers)
-    attach_keywords(cursor, papers)
-    entries = []
-    for paper in papers:
-        # Always include arXiv entry
-        entries.append(arxiv2bib(paper))
-        # If published, also include the published entry
-        if paper.get('doi'):
-            pub_bib = published_doi_bibtex(paper['doi'], paper)
-            if pub_bib:
-                entries.append(pub_bib)
-
     cursor.close()
+    split_authors(papers)
+    # Hand the connection back now; streaming may wait on doi.org for a while
+    close_db_connection()
+
+    def generate():
+        # Published entries each need a doi.org request; overlap them. Only a
+        # window of lookups is queued ahead of the entry being streamed, so a
+        # client that disconnects doesn't leave the worker busy with the rest.
+        pool = ThreadPoolExecutor(max_workers=DOI_FETCH_WORKERS)
+        remaining = iter(papers)
+        pending = deque()   # (paper, future or None), in paper order
+
+        def submit_next():
+            paper = next(remaining, None)
+            if paper is not None:
+                future = (pool.submit(_doi_bibtex_or_fallback, paper['doi'], paper)
+                          if paper['doi'] else None)
+                pending.append((paper, future))
 
-    bibtex_all = '\n\n'.join(entries)
-    return bibtex_all, 200, {'Content-Type': 'text/plain; charset=utf-8'}
+        try:
+            for _ in range(DOI_FETCH_WINDOW):
+                submit_next()
+            separator = ''
+            # Copy of the body for the cache; dropped once it is too big to
+            # keep or a fallback entry makes it non-authoritative
+            chunks, size = [], 0
+            while pending:
+                paper, future = pending.popleft()
+                submit_next()
+                pub_bib = None
+                if future:
+                    pub_bib, from_doi_org = future.result()
+                    if not from_doi_org:
+                        chunks = None   # doi.org failed; don't cache the fallback
+                # Always include the arXiv entry, followed by the published one if any
+                for entry in (arxiv2bib(paper), pub_bib):
+                    if entry:
+                        chunk = separator + entry
+                        if chunks is not None:
+                            size += len(chunk)
+                            if size > BIBTEX_AUTHOR_CACHE_MAX_BYTES:
+                                chunks = None
+                            else:
+                                chunks.append(chunk)
+                        yield chunk
+                        separator = '\n\n'
+            if chunks is not None:
+                _put_cached_bibtex(etag, ''.join(chunks))
+        finally:
+            # On disconnect, drop queued lookups rather than waiting for them
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    # Headers go out before we know whether every doi.org lookup succeeds, so
+    # a streamed body carries no ETag; the next request gets the cached copy
+    # (with ETag) if this one turned out complete.
+    return _bibtex_response(generate(), None)
+
+
+# ── Background /fetch jobs ────────────────────────────────────────────────────
+# A fetch can take minutes; run it off the request thread so the worker keeps
+# serving pages. One job at a time, and only the last few are remembered.
+# Job state lives in this process, so poll the status URL on the same worker.
+FETCH_JOBS_KEPT = 20
+_fetch_executor = ThreadPoolExecutor(max_workers=1)
+_fetch_jobs = OrderedDict()   # {job_id: (future, output buffer)}
+_fetch_jobs_lock = threading.Lock()
+
+
+def _run_fetch_job(days, output):
+    """Fetch recent papers, then refresh site_stats and the in-process caches."""
+    from fetch_arxiv import fetch_recent_papers
+    try:
+        # Only this thread's prints go to the job log
+        with capture_stdout(output):
+            fetch_recent_papers(days=days)
+
+        conn = get_pooled_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO site_stats (id, paper_count, author_count, latest_date)
+                SELECT 1, COUNT(*), (SELECT COUNT(*) FROM authors), MAX(published_date)
+                FROM papers
+                ON DUPLICATE KEY UPDATE
+                    paper_count  = VALUES(paper_count),
+                    author_count = VALUES(author_count),
+                    latest_date  = VALUES(latest_date)
+            """)
+            conn.commit()
+            cursor.close()
+        finally:
+            conn.close()
+    except Exception:
+        logger.exception("Background fetch (days=%d) failed", days)
+        raise
+    finally:
+        # Even a failed run may have inserted papers
+        clear_site_stats_cache()
+        clear_bibtex_cache()
+        clear_browse_cache()
+        rebuild_index_cache()
+
+
+def _check_fetch_key():
+    if not FETCH_SECRET or request.args.get('key', '') != FETCH_SECRET:
+        logger.warning("Unauthorized %s attempt from %s", request.path, request.remote_addr)
+        abort(403)
 
 
 @app.route('/fetch')
 def fetch_papers():
-    """Fetch recent papers from arXiv. Requires secret key."""
-    key = request.args.get('key', '')
-    days = request.args.get('days', 1, type=int)
+    """Start a fetch of recent papers from arXiv. Requires secret key.
 
-    if not FETCH_SECRET or key != FETCH_SECRET:
-        logger.warning("Unauthorized /fetch attempt from %s", request.remote_addr)
-        abort(403)
+    Returns a job id immediately (202); poll /fetch/status/<job_id> for the
+    log. With ?wait=1 the request blocks and returns the log as plain text.
+    """
+    _check_fetch_key()
+    days = request.args.get('days', 1, type=int)
 
     # Cap days to prevent abuse
     days = min(days, 30)
     logger.info("/fetch triggered: days=%d from %s", days, request.remote_addr)
 
-    from fetch_arxiv import fetch_recent_papers
     output = io.StringIO()
-    with contextlib.redirect_stdout(output):
-        fetch_recent_papers(days=days)
-
-    # Refresh cached stats
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO site_stats (id, paper_count, author_count, latest_date)
-        SELECT 1, COUNT(*), (SELECT COUNT(*) FROM authors), MAX(published_date)
-        FROM papers
-        ON DUPLICATE KEY UPDATE
-            paper_count  = VALUES(paper_count),
-            author_count = VALUES(author_count),
-            latest_date  = VALUES(latest_date)
-    """)
-    conn.commit()
-    cursor.close()
-
-    # Rebuild the index page cache with fresh data
-    rebuild_index_cache()
-
-    return output.getvalue(), 200, {'Content-Type': 'text/plain; charset=utf-8'}
+    future = _fetch_executor.submit(_run_fetch_job, days, output)
+    job_id = uuid.uuid4().hex
+    with _fetch_jobs_lock:
+        _fetch_jobs[job_id] = (future, output)
+        while len(_fetch_jobs) > FETCH_JOBS_KEPT:
+            _fetch_jobs.popitem(last=False)
+
+    if request.args.get('wait', '').lower() in ('1', 'true', 'on', 'yes'):
+        future.result()
+        return output.getvalue(), 200, {'Content-Type': 'text/plain; charset=utf-8'}
+
+    status_url = url_for('fetch_status', job_id=job_id, key=request.args.get('key'))
+    return jsonify({'ok': True, 'job_id': job_id, 'status_url': status_url}), 202
+
+
+@app.route('/fetch/status/<job_id>')
+def fetch_status(job_id):
+    """Report progress of a /fetch job started by this process."""
+    _check_fetch_key()
+    with _fetch_jobs_lock:
+        job = _fetch_jobs.get(job_id)
+    if not job:
+        abort(404)
+    future, output = job
+    result = {
+        'ok': True,
+        'job_id': job_id,
+        'done': future.done(),
+        'output': output.getvalue(),
+    }
+    if future.done() and future.exception():
+        result['ok'] = False
+        result['error'] = str(future.exception())
+    return jsonify(result)
 
 
 if __name__ == '__main__':
@@ -21,6 +21,14 @@ DB_CONFIG = {
     'charset': os.getenv('DB_CHARSET', 'utf8mb4')
 }
 
+# Per-process connection pool for the web app (see db.get_db_connection).
+# Size DB_POOL_MAX_CONNECTIONS so that workers x max stays under MariaDB's max_connections.
+DB_POOL_CONFIG = {
+    'mincached':      int(os.getenv('DB_POOL_MIN_CACHED', '2')),
+    'maxcached':      int(os.getenv('DB_POOL_MAX_CACHED', '8')),
+    'maxconnections': int(os.getenv('DB_POOL_MAX_CONNECTIONS', '16')),
+}
+
 # Flask configuration
 FLASK_CONFIG = {
     'SECRET_KEY': os.getenv('FLASK_SECRET_KEY', DEFAULT_FLASK_SECRET_KEY),
@@ -2,13 +2,17 @@
 db.py - Shared database helpers for all Flask blueprints.
 
 All modules should import get_db_connection from here instead of duplicating
-the per-request g.db caching pattern.  app.py registers close_db_connection
-as a teardown handler so the connection is closed once at end-of-request.
+the per-request g.db caching pattern.  Connections come from a per-process
+pool; app.py registers close_db_connection as a teardown handler so the
+connection is returned to the pool once at end-of-request.
 """
 
 import pymysql
+from dbutils.pooled_db import PooledDB
 from flask import g, session, abort
-from config import DB_CONFIG
+from config import DB_CONFIG, DB_POOL_CONFIG
+
+_pool = None
 
 
 def require_user():
@@ -19,15 +23,42 @@ def require_user():
     return user_id
 
 
+def _get_pool():
+    """Create the connection pool on first use (not at import, so a DB outage
+    at startup doesn't prevent the app from loading)."""
+    global _pool
+    if _pool is None:
+        _pool = PooledDB(
+            creator=pymysql,
+            blocking=True,   # wait for a free connection instead of raising
+            ping=1,          # check liveness when a connection is taken out
+            **DB_POOL_CONFIG,
+            **DB_CONFIG,
+            cursorclass=pymysql.cursors.DictCursor,
+            # MySQL's default 1024-byte limit would truncate long author lists
+            init_command="SET SESSION group_concat_max_len = 65535",
+        )
+    return _pool
+
+
+def get_pooled_connection():
+    """Return a pooled DB connection for use outside a request (startup, cache
+    rebuilds).  The caller must close() it to return it to the pool."""
+    return _get_pool().connection()
+
+
 def get_db_connection():
-    """Return a per-request DB connection (cached on g, closed on teardown)."""
+    """Return a per-request pooled DB connection (cached on g, released on teardown)."""
     if 'db' not in g:
-        g.db = pymysql.connect(**DB_CONFIG, cursorclass=pymysql.cursors.DictCursor)
+        g.db = get_pooled_connection()
     return g.db
 
 
 def close_db_connection(e=None):
-    """Teardown: close the per-request DB connection if one was opened."""
+    """Teardown: return the per-request DB connection to the pool.
+
+    The pool rolls back any uncommitted transaction before reuse.
+    """
     db = g.pop('db', None)
     if db is not None:
         db.close()
@@ -35,6 +66,27 @@ def close_db_connection(e=None):
 
 # ── Paper data helpers ─────────────────────────────────────────────────────────
 
+# ASCII unit separator: cannot occur in author names, safe to split on.
+AUTHOR_SEPARATOR = '\x1f'
+
+# Select-list column returning a paper's authors (in order) as one string, so
+# listing queries get authors without a second round-trip.  The papers table
+# must be aliased as p; call split_authors() on the fetched rows.
+AUTHORS_CONCAT_SQL = f"""(
+            SELECT GROUP_CONCAT(a.name ORDER BY pa.author_order SEPARATOR '{AUTHOR_SEPARATOR}')
+            FROM paper_authors pa
+            JOIN authors a ON a.id = pa.author_id
+            WHERE pa.paper_id = p.id
+        ) AS authors_concat"""
+
+
+def split_authors(papers):
+    """Turn each paper's 'authors_concat' column into an 'authors' list."""
+    for paper in papers:
+        concat = paper.pop('authors_concat', None)
+        paper['authors'] = concat.split(AUTHOR_SEPARATOR) if concat else []
+
+
 def get_paper_authors(cursor, paper_id):
     """Return an ordered list of author names for a single paper."""
     cursor.execute("""
@@ -47,6 +99,24 @@ def get_paper_authors(cursor, paper_id):
     return [row['name'] for row in cursor.fetchall()]
 
 
+def fetch_paper_by_arxiv_id(cursor, arxiv_id, columns):
+    """Return one paper dict by arXiv ID with 'authors' filled in, or None.
+
+    columns is the select list for the papers table (aliased p); the authors
+    come back in the same query instead of a get_paper_authors() round-trip.
+    """
+    cursor.execute(f"""
+        SELECT {columns},
+               {AUTHORS_CONCAT_SQL}
+        FROM papers p
+        WHERE p.arxiv_id = %s
+    """, (arxiv_id,))
+    paper = cursor.fetchone()
+    if paper:
+        split_authors([paper])
+    return paper
+
+
 def attach_authors(cursor, papers):
     """Attach an 'authors' list to each paper dict (single batched query)."""
     if not papers:
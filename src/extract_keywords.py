@@ -8,13 +8,18 @@ for manual curation into a keyword tag list.
 Usage:
     python3 extract_keywords.py
     python3 extract_keywords.py --min-count 3 --max-ngram 4 --output keywords.csv
+    python3 extract_keywords.py --workers 1          # no worker processes
 """
 
 import re
 import csv
 import argparse
+import multiprocessing
+import os
 import unicodedata
-from collections import defaultdict
+from collections import Counter
+from functools import lru_cache, partial
+from operator import itemgetter
 
 import inflect
 import pymysql
@@ -91,40 +96,46 @@ MATH_SINGULAR_OVERRIDES = {
 
 def singularize(word: str) -> str:
     """Return the singular form of a word, with caching for performance."""
-    if word not in _singular_cache:
-        if word in MATH_SINGULAR_OVERRIDES:
-            _singular_cache[word] = MATH_SINGULAR_OVERRIDES[word]
-        elif word in STOPWORDS:
-            # Don't singularize stopwords — inflect mangles function words
-            # (e.g. this->thi, was->wa) producing forms that bypass the filter
-            _singular_cache[word] = word
-        elif word.endswith('less') or word.endswith('ness'):
-            # inflect strips the final 's' from -less/-ness words
-            # (signless->signles, completeness->completenes)
-            _singular_cache[word] = word
-        elif word.endswith('ous'):
-            # inflect strips the final 's' from -ous words
-            # (ubiquitous->ubiquitou, continuous->continuou, homogeneous->homogeneou)
-            _singular_cache[word] = word
-        elif word.endswith('ss'):
-            # inflect strips the final 's' from -ss words (success->succes,
-            # stress->stres, guess->gues, chess->ches, progress->progres)
-            # Note: 'class' is already handled via MATH_SINGULAR_OVERRIDES
-            _singular_cache[word] = word
-        elif word.endswith('is'):
-            # -is words are either already overridden above (axis, basis, analysis)
-            # or are proper names (lewis, harris, davis, morris) that inflect
-            # mangles to -i by stripping the final 's'
-            _singular_cache[word] = word
-        else:
-            result = _inflect.singular_noun(word)
-            _singular_cache[word] = result if result else word
-    return _singular_cache[word]
+    cached = _singular_cache.get(word)
+    if cached is None:
+        cached = _singular_cache[word] = _singularize_uncached(word)
+    return cached
+
+
+def _singularize_uncached(word: str) -> str:
+    """Compute the singular of a word not yet in _singular_cache."""
+    if word in MATH_SINGULAR_OVERRIDES:
+        return MATH_SINGULAR_OVERRIDES[word]
+    elif word in STOPWORDS:
+        # Don't singularize stopwords — inflect mangles function words
+        # (e.g. this->thi, was->wa) producing forms that bypass the filter
+        return word
+    elif word.endswith('less') or word.endswith('ness'):
+        # inflect strips the final 's' from -less/-ness words
+        # (signless->signles, completeness->completenes)
+        return word
+    elif word.endswith('ous'):
+        # inflect strips the final 's' from -ous words
+        # (ubiquitous->ubiquitou, continuous->continuou, homogeneous->homogeneou)
+        return word
+    elif word.endswith('ss'):
+        # inflect strips the final 's' from -ss words (success->succes,
+        # stress->stres, guess->gues, chess->ches, progress->progres)
+        # Note: 'class' is already handled via MATH_SINGULAR_OVERRIDES
+        return word
+    elif word.endswith('is'):
+        # -is words are either already overridden above (axis, basis, analysis)
+        # or are proper names (lewis, harris, davis, morris) that inflect
+        # mangles to -i by stripping the final 's'
+        return word
+    else:
+        result = _inflect.singular_noun(word)
+        return result if result else word
 
 
 # Common English words and math paper boilerplate to ignore as standalone terms.
-# Multi-word phrases are only filtered if they start/end with these.
-STOPWORDS = {
+# Phrases containing any of these are dropped as candidates.
+STOPWORDS = frozenset({
     'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
     'of', 'with', 'by', 'from', 'as', 'is', 'are', 'was', 'were', 'be',
     'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
@@ -195,28 +206,43 @@ STOPWORDS = {
     'zero', 'zeroth',
     'nevertheless',
     'consensus',
-}
+})
+
+# Words with a fixed answer never need to reach inflect
+_singular_cache.update({w: w for w in STOPWORDS})
+_singular_cache.update(MATH_SINGULAR_OVERRIDES)
+
+
+# LaTeX stripping patterns, compiled once (strip_latex runs on every abstract)
+_RE_DISPLAY_MATH = re.compile(r'\$\$.*?\$\$', re.DOTALL)
+_RE_INLINE_MATH  = re.compile(r'\$[^$]*?\$')
+# Accent commands, one pass: letter accents need braces (\H{o}, \c{s}) so that
+# \cite etc. are left alone; symbol accents take them optionally (\"{o}, \"o)
+_RE_ACCENT       = re.compile(r'\\(?:[Hcvkrudbt](?=\{[a-zA-Z]\})|["\'\`\^~\.=])(\{)?([a-zA-Z])(?(1)\})')
+_RE_CMD_ARG      = re.compile(r'\\[a-zA-Z]+\{[^}]*\}')
+_RE_BARE_CMD     = re.compile(r'\\[a-zA-Z]+')
+_RE_BRACES       = re.compile(r'[{}]')
+# Alphabetic words and hyphenated compounds (e.g. "q-analog")
+_RE_WORD         = re.compile(r'[a-z]+(?:-[a-z]+)*')
 
 
 def strip_latex(text):
     """Remove LaTeX markup, keeping natural language words."""
-    # Display math $$...$$
-    text = re.sub(r'\$\$.*?\$\$', ' ', text, flags=re.DOTALL)
-    # Inline math $...$
-    text = re.sub(r'\$[^$]*?\$', ' ', text)
-    # Accent commands: strip accent but keep base letter (e.g. \"{o}->o, \H{o}->o)
-    # Handles names like Möbius (M\"{o}bius -> Mobius) and Erdős (Erd\H{o}s -> Erdos)
-    text = re.sub(r'\\[Hcvkrudbt]\{([a-zA-Z])\}', r'\1', text)   # \H{o}, \c{s}, etc.
-    text = re.sub(r'\\["\'\`\^~\.=]\{([a-zA-Z])\}', r'\1', text)  # \"{o}, \'{e}, etc.
-    text = re.sub(r'\\["\'\`\^~\.=]([a-zA-Z])', r'\1', text)       # \"o, \'e, etc.
-    # \command{...} — remove whole thing
-    text = re.sub(r'\\[a-zA-Z]+\{[^}]*\}', ' ', text)
-    # Bare \command tokens
-    text = re.sub(r'\\[a-zA-Z]+', ' ', text)
-    # Remaining braces
-    text = re.sub(r'[{}]', ' ', text)
+    # Each stage is skipped when its trigger character is absent (plain titles)
+    if '$' in text:
+        text = _RE_DISPLAY_MATH.sub(' ', text)
+        text = _RE_INLINE_MATH.sub(' ', text)
+    if '\\' in text:
+        # Strip accent but keep base letter: M\"{o}bius -> Mobius, Erd\H{o}s -> Erdos
+        text = _RE_ACCENT.sub(r'\2', text)
+        # \command{...} — remove whole thing
+        text = _RE_CMD_ARG.sub(' ', text)
+        text = _RE_BARE_CMD.sub(' ', text)
+    if '{' in text or '}' in text:
+        text = _RE_BRACES.sub(' ', text)
     # Normalize Unicode accented letters to ASCII (e.g. Möbius -> Mobius, Erdős -> Erdos)
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
     return text
 
 
@@ -224,28 +250,67 @@ def tokenize(text):
     """Lowercase, strip LaTeX, and split into alphabetic word tokens."""
     text = strip_latex(text)
     text = text.lower()
-    # Keep alphabetic words and hyphenated compounds (e.g. "q-analog"), then singularize
-    tokens = re.findall(r'[a-z]+(?:-[a-z]+)*', text)
-    return [singularize(t) for t in tokens]
+    tokens = _RE_WORD.findall(text)
+    # Inline the cache hit; cached singulars are never empty
+    cached = _singular_cache.get
+    return [cached(t) or singularize(t) for t in tokens]
 
 
-def extract_ngrams(tokens, max_n):
-    """Yield all n-grams as strings for n in 1..max_n."""
-    for n in range(1, max_n + 1):
-        for i in range(len(tokens) - n + 1):
-            yield ' '.join(tokens[i:i + n])
+@lru_cache(maxsize=4096)
+def _tokenize_cached(text):
+    """tokenize() as a tuple, memoized so repeated title+abstract texts run once."""
+    return tuple(tokenize(text))
 
 
-def is_useful(phrase):
-    """Return True if the phrase is a plausible keyword candidate."""
-    words = phrase.split()
-    # Drop single-character tokens
-    if any(len(w) <= 1 for w in words):
-        return False
-    # Drop any phrase containing a stopword anywhere
-    if any(w in STOPWORDS for w in words):
-        return False
-    return True
+def extract_ngrams(tokens, max_n):
+    """Yield candidate keyword n-grams as strings for n in 1..max_n.
+
+    Phrases containing a stopword or a single-character token anywhere are
+    skipped before their string is built.
+    """
+    stopwords = STOPWORDS
+    # clean_run[i] = number of consecutive usable tokens starting at i
+    clean_run = [0] * (len(tokens) + 1)
+    for i in range(len(tokens) - 1, -1, -1):
+        token = tokens[i]
+        if len(token) > 1 and token not in stopwords:
+            clean_run[i] = clean_run[i + 1] + 1
+    join = ' '.join
+    for n in range(1, max_n + 1):
+        # zip over shifted copies yields each n-token window as a tuple
+        windows = zip(*(tokens[k:] for k in range(n)))
+        for run, window in zip(clean_run, windows):
+            if run >= n:
+                yield join(window)
+
+
+def process_paper(row, max_n):
+    """Return the distinct candidate phrases of one (id, title, abstract) row.
+
+    Phrases come back in first-occurrence order so that merging results in
+    paper order gives the same ranking as a serial run.
+    """
+    _, title, abstract = row
+    text = (title or '') + ' ' + (abstract or '')
+    tokens = _tokenize_cached(text)
+    return tuple(dict.fromkeys(extract_ngrams(tokens, max_n)))
+
+
+def iter_papers(cursor, batch_size):
+    """Yield (id, title, abstract) rows in id order, one keyset batch at a time."""
+    last_id = 0
+    while True:
+        cursor.execute("""
+            SELECT id, title, abstract FROM papers
+            WHERE id > %s
+            ORDER BY id
+            LIMIT %s
+        """, (last_id, batch_size))
+        batch = cursor.fetchall()
+        if not batch:
+            return
+        yield from batch
+        last_id = batch[-1][0]
 
 
 def main():
@@ -258,50 +323,65 @@ def main():
                         help='Max n-gram length in words (default: 4)')
     parser.add_argument('--output', default='keywords.csv',
                         help='Output CSV file (default: keywords.csv)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for n-gram extraction (default: CPU count)')
+    parser.add_argument('--batch', type=int, default=10000,
+                        help='Papers fetched per DB query (default: 10000)')
     args = parser.parse_args()
 
     print("Connecting to database...")
     conn = pymysql.connect(**DB_CONFIG)
     cursor = conn.cursor()
 
-    print("Fetching papers...")
-    cursor.execute("SELECT id, title, abstract FROM papers")
-    papers = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    print(f"  {len(papers):,} papers loaded.")
-
-    # Map phrase -> set of paper IDs (so each paper counts once per phrase)
-    phrase_papers = defaultdict(set)
-
-    print(f"Extracting n-grams (1–{args.max_ngram} words)...")
-    for i, (paper_id, title, abstract) in enumerate(papers):
-        if i % 10000 == 0:
-            print(f"  {i:,} / {len(papers):,}...")
-        text = (title or '') + ' ' + (abstract or '')
-        tokens = tokenize(text)
-        seen_in_this_paper = set()
-        for phrase in extract_ngrams(tokens, args.max_ngram):
-            if phrase not in seen_in_this_paper and is_useful(phrase):
-                phrase_papers[phrase].add(paper_id)
-                seen_in_this_paper.add(phrase)
-
-    print(f"  {len(phrase_papers):,} unique phrases found.")
-
-    # Filter by min count and sort descending
+    cursor.execute("SELECT COUNT(*) FROM papers")
+    (total,) = cursor.fetchone()
+    print(f"Fetching {total:,} papers in batches of {args.batch:,}...")
+    # Short keyset queries instead of one long-lived result set; with a pool,
+    # its feeder thread fetches the next batch while workers are busy
+    papers = iter_papers(cursor, args.batch)
+
+    # Map phrase -> number of papers it appears in (each paper counts once)
+    phrase_counts = Counter()
+
+    print(f"Extracting n-grams (1–{args.max_ngram} words, {args.workers} workers)...")
+    extract = partial(process_paper, max_n=args.max_ngram)
+    pool = multiprocessing.Pool(args.workers) if args.workers > 1 else None
+    try:
+        # imap (not imap_unordered) keeps paper order, and thus tie order in the CSV
+        results = pool.imap(extract, papers, chunksize=256) if pool else map(extract, papers)
+        for i, phrases in enumerate(results):
+            if i % 10000 == 0:
+                print(f"  {i:,} / {total:,}...")
+            phrase_counts.update(phrases)
+        if pool:
+            pool.close()
+            pool.join()
+    finally:
+        if pool:
+            # No-op after a clean join; on an error or Ctrl-C, stop the workers
+            # instead of waiting for them to drain the remaining papers
+            pool.terminate()
+        cursor.close()
+        conn.close()
+
+    print(f"  {len(phrase_counts):,} unique phrases found.")
+
+    # Filter by min count first (most phrases are rare), then sort descending;
+    # the sort is stable, so ties keep first-seen order like most_common()
     filtered = [
-        (phrase, len(ids))
-        for phrase, ids in phrase_papers.items()
-        if len(ids) >= args.min_count
+        (phrase, count)
+        for phrase, count in phrase_counts.items()
+        if count >= args.min_count
     ]
-    filtered.sort(key=lambda x: -x[1])
+    filtered.sort(key=itemgetter(1), reverse=True)
 
     print(f"  {len(filtered):,} phrases appear in >= {args.min_count} papers.")
 
-    with open(args.output, 'w', newline='', encoding='utf-8') as f:
+    with open(args.output, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(['phrase', 'paper_count', 'word_count'])
-        writer.writerows([(phrase, count, len(phrase.split())) for phrase, count in filtered])
+        # Phrases are single-space joined, so words = spaces + 1
+        writer.writerows((phrase, count, phrase.count(' ') + 1) for phrase, count in filtered)
 
     print(f"Done! Written to: {args.output}")
 
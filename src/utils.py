@@ -1,44 +1,68 @@
 """Shared utility functions."""
 
+import contextlib
 import re
+import sys
+import threading
 import unicodedata
 
 
-def strip_accents(text):
-    """Strip diacritics/accents from text: Erdos -> Erdos, Garcia -> Garcia."""
+def _strip_accents_slow(text):
     nfkd = unicodedata.normalize('NFKD', text)
     return ''.join(c for c in nfkd if not unicodedata.combining(c))
 
 
+# Precomputed results for the code points names actually contain: Latin-1
+# Supplement, Latin Extended-A/B, combining diacritics, Latin Extended
+# Additional and general punctuation. NFKD decomposes per character and only
+# drops combining marks, so a per-character table gives the same result.
+_STRIP_ACCENTS_TABLE = {
+    cp: _strip_accents_slow(chr(cp)) or None
+    for start, stop in ((0x00A0, 0x0250), (0x0300, 0x0370), (0x1E00, 0x1F00), (0x2000, 0x2070))
+    for cp in range(start, stop)
+    if _strip_accents_slow(chr(cp)) != chr(cp)
+}
+
+
+def strip_accents(text):
+    """Strip diacritics/accents from text: Erdős -> Erdos, García -> Garcia."""
+    if text.isascii():
+        return text
+    text = text.translate(_STRIP_ACCENTS_TABLE)
+    # Characters outside the table (Greek, CJK, ...) take the unicodedata path
+    return text if text.isascii() else _strip_accents_slow(text)
+
+
+_SLUG_DROP_RE = re.compile(r"[^a-z0-9\s-]")
+_SLUG_SEPARATOR_RE = re.compile(r'[\s-]+')
+
+
 def slugify(name):
     """Convert a name to a URL-friendly slug: 'Per Alexandersson' -> 'per-alexandersson'."""
     s = strip_accents(name).lower()
-    s = re.sub(r"[^a-z0-9\s-]", '', s)   # remove non-alphanumeric (keep spaces and hyphens)
-    s = re.sub(r'[\s]+', '-', s.strip())  # spaces to hyphens
-    s = re.sub(r'-+', '-', s)             # collapse multiple hyphens
-    return s
+    s = _SLUG_DROP_RE.sub('', s)                  # remove non-alphanumeric (keep spaces and hyphens)
+    return _SLUG_SEPARATOR_RE.sub('-', s.strip())  # spaces/hyphen runs to a single hyphen
 
 
 # ── BibTeX helpers ─────────────────────────────────────────────────────────────
 
+_CAPITALS_RE = re.compile(r'[A-Z]+')
+
+
 def protect_capitals_for_bibtex(title):
     """Wrap capital letters in braces so BibTeX won't lowercase them.
 
     The first character is left unprotected (BibTeX preserves it regardless).
+    Runs of capitals (acronyms) are wrapped as a single group.
     Example: 'A new formula for Macdonald polynomials using LLT polynomials'
           -> 'A new formula for {M}acdonald polynomials using {LLT} polynomials'
     """
     if not title:
         return title
-
-    def _protect(match):
-        return f"{{{match.group(0)}}}"
-
-    first_char = title[0]
     rest = title[1:]
-    rest = re.sub(r'[A-Z]{2,}', _protect, rest)   # acronyms first
-    rest = re.sub(r'[A-Z]',     _protect, rest)   # remaining singles
-    return first_char + rest
+    if rest.islower():
+        return title   # nothing to protect; skip the regex entirely
+    return title[0] + _CAPITALS_RE.sub(r'{\g<0>}', rest)
 
 
 def generate_bibtex_key(authors, year, published=False):
@@ -50,14 +74,23 @@ def generate_bibtex_key(authors, year, published=False):
     if authors:
         last_names = []
         for author in authors:
-            last_name = author.split()[-1]
-            last_name = strip_accents(last_name)
-            last_name = ''.join(c for c in last_name if c.isalnum())
+            last_name = strip_accents(author.split()[-1])
+            # Most surnames are already alphanumeric; only filter the rest
+            if not last_name.isalnum():
+                last_name = ''.join(c for c in last_name if c.isalnum())
             last_names.append(last_name)
         return f"{''.join(last_names)}{year}{suffix}"
     return f"arxiv{year}{suffix}"
 
 
+def strip_arxiv_version(arxiv_id):
+    """Drop a trailing version suffix: '2401.01234v2' -> '2401.01234'."""
+    i = arxiv_id.rfind('v')
+    if i != -1 and arxiv_id[i + 1:].isdecimal():
+        return arxiv_id[:i]
+    return arxiv_id
+
+
 def arxiv2bib(paper_data):
     """Generate an arXiv-style BibTeX entry from a paper dict.
 
@@ -68,7 +101,7 @@ def arxiv2bib(paper_data):
     key  = generate_bibtex_key(paper_data.get('authors', []), year, published=False)
 
     author_str      = ' and '.join(paper_data.get('authors', [])) or 'Unknown'
-    clean_arxiv_id  = re.sub(r'v\d+$', '', paper_data['arxiv_id'])
+    clean_arxiv_id  = strip_arxiv_version(paper_data['arxiv_id'])
     protected_title = protect_capitals_for_bibtex(paper_data['title'])
 
     bib = (
@@ -122,3 +155,50 @@ def suggest_sf_labels(phrase, sf_labels, limit=8):
         elif len(words) > 1 and all(w in title_lower for w in words):
             suggestions.append((key, label, 'words in title'))
     return suggestions[:limit]
+
+
+# ── Per-thread stdout capture ─────────────────────────────────────────────────
+# The fetch scripts report progress with print(). contextlib.redirect_stdout
+# swaps the process-wide sys.stdout, so two overlapping captures on different
+# threads mix their logs and can restore each other's buffer for good.
+# capture_stdout() routes only the calling thread's writes instead.
+
+class _ThreadRoutedStdout:
+    """sys.stdout stand-in that sends each thread's writes to its own target."""
+
+    def __init__(self, default):
+        self.default = default
+        self.local = threading.local()
+
+    def _target(self):
+        return getattr(self.local, 'target', None) or self.default
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        return self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+
+_stdout_router = None
+_stdout_router_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def capture_stdout(stream):
+    """Send print() output from the current thread to stream while active."""
+    global _stdout_router
+    with _stdout_router_lock:
+        if sys.stdout is not _stdout_router:
+            _stdout_router = _ThreadRoutedStdout(sys.stdout)
+            sys.stdout = _stdout_router
+        router = _stdout_router
+    previous = getattr(router.local, 'target', None)
+    router.local.target = stream
+    try:
+        yield stream
+    finally:
+        router.local.target = previous
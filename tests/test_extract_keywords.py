@@ -0,0 +1,68 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from extract_keywords import extract_ngrams, process_paper, strip_latex, tokenize
+
+
+class StripLatexTests(unittest.TestCase):
+    def test_accent_commands_keep_the_base_letter(self):
+        self.assertEqual('Mobius', strip_latex(r'M\"{o}bius'))
+        self.assertEqual('Erdos', strip_latex(r'Erd\H{o}s'))
+        self.assertEqual('o', strip_latex(r'\"o'))
+        self.assertEqual('Mobius', strip_latex(r'M\"obius'))
+
+    def test_commands_are_removed_without_stray_letters(self):
+        self.assertEqual(['see', 'and', 'here'],
+                         strip_latex(r'see \cite{x} and \emph{y} here').split())
+        self.assertEqual(['over', 'the', 'field'],
+                         strip_latex(r'over the \mathbb field').split())
+
+    def test_math_and_lone_braces_are_removed(self):
+        self.assertEqual(['a', 'b'], strip_latex('a } b').split())
+        self.assertEqual(['for', 'all'], strip_latex('for $n \\geq 1$ all').split())
+        self.assertEqual(['where'], strip_latex('where $$x^2$$').split())
+
+    def test_unicode_accents_are_folded(self):
+        self.assertEqual('Mobius Erdos', strip_latex('Möbius Erdős'))
+
+
+class TokenizeTests(unittest.TestCase):
+    def test_lowercases_and_singularizes(self):
+        self.assertEqual(['schur', 'function', 'and', 'q-analog'],
+                         tokenize(r'Schur functions and $q$ q-analogs'))
+
+
+class ExtractNgramsTests(unittest.TestCase):
+    def test_windows_with_stopwords_or_single_letters_are_dropped(self):
+        tokens = ['schur', 'function', 'of', 'a', 'x', 'positive', 'schur', 'function']
+        self.assertEqual(
+            ['schur', 'function', 'positive', 'schur', 'function',
+             'schur function', 'positive schur', 'schur function',
+             'positive schur function'],
+            list(extract_ngrams(tokens, 3)),
+        )
+
+    def test_short_token_lists(self):
+        self.assertEqual([], list(extract_ngrams([], 3)))
+        self.assertEqual(['schur'], list(extract_ngrams(['schur'], 3)))
+        self.assertEqual([], list(extract_ngrams(['the', 'x'], 2)))
+
+
+class ProcessPaperTests(unittest.TestCase):
+    def test_phrases_are_distinct_in_first_occurrence_order(self):
+        self.assertEqual(
+            ('schur', 'function', 'positivity',
+             'schur function', 'function schur', 'schur positivity'),
+            process_paper((1, 'Schur functions', 'Schur functions and Schur positivity'), 2),
+        )
+
+    def test_missing_title_or_abstract(self):
+        self.assertEqual(('tableau',), process_paper((1, None, 'Tableaux'), 3))
+        self.assertEqual((), process_paper((1, None, None), 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import io
+import sys
+import threading
+import unicodedata
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from utils import (capture_stdout, generate_bibtex_key, protect_capitals_for_bibtex, slugify,
+                   strip_accents, strip_arxiv_version)
+
+
+class ProtectCapitalsTests(unittest.TestCase):
+    def test_wraps_single_capitals_and_acronyms(self):
+        self.assertEqual(
+            'A new formula for {M}acdonald polynomials using {LLT} polynomials',
+            protect_capitals_for_bibtex(
+                'A new formula for Macdonald polynomials using LLT polynomials'
+            ),
+        )
+
+    def test_first_character_is_left_unprotected(self):
+        self.assertEqual('Schur {P}-functions', protect_capitals_for_bibtex('Schur P-functions'))
+        self.assertEqual('S{LAM}', protect_capitals_for_bibtex('SLAM'))
+
+    def test_empty_and_lowercase_titles_are_unchanged(self):
+        self.assertEqual('', protect_capitals_for_bibtex(''))
+        self.assertIsNone(protect_capitals_for_bibtex(None))
+        self.assertEqual('on plane partitions', protect_capitals_for_bibtex('on plane partitions'))
+
+
+class BibtexKeyTests(unittest.TestCase):
+    def test_concatenates_clean_last_names(self):
+        self.assertEqual(
+            'AlexanderssonErdosOConnor2024x',
+            generate_bibtex_key(['Per Alexandersson', 'Paul Erdős', "Mary O'Connor"], 2024),
+        )
+        self.assertEqual(
+            'DvorakSmith2020',
+            generate_bibtex_key(['Jan Dvořák-Smith'], 2020, published=True),
+        )
+
+    def test_falls_back_to_arxiv_without_authors(self):
+        self.assertEqual('arxiv2024x', generate_bibtex_key([], 2024))
+
+
+class StripAccentsTests(unittest.TestCase):
+    def test_strips_diacritics_from_names(self):
+        self.assertEqual('Paul Erdos', strip_accents('Paul Erdős'))
+        self.assertEqual('Jan Dvorak-Smith', strip_accents('Jan Dvořák-Smith'))
+        self.assertEqual('Per Alexandersson', strip_accents('Per Alexandersson'))
+
+    def test_table_matches_unicodedata(self):
+        samples = ['Möbius', 'Łukasz Ø', 'ﬁbre', 'Nguyễn', 'e\u0301', 'Αλέξης', '—', 'ß']
+        for cp in range(0x00A0, 0x2070):
+            samples.append(chr(cp))
+        for text in samples:
+            nfkd = unicodedata.normalize('NFKD', text)
+            expected = ''.join(c for c in nfkd if not unicodedata.combining(c))
+            self.assertEqual(expected, strip_accents(text), repr(text))
+
+
+class SlugifyTests(unittest.TestCase):
+    def test_existing_slug_shapes_are_preserved(self):
+        self.assertEqual('per-alexandersson', slugify('Per Alexandersson'))
+        self.assertEqual('paul-erdos', slugify('  Paul  Erdős '))
+        self.assertEqual('mary-oconnor', slugify("Mary O'Connor"))
+        self.assertEqual('jan-dvorak-smith', slugify('Jan Dvořák - Smith'))
+        self.assertEqual('-x', slugify('-x'))
+
+
+class StripArxivVersionTests(unittest.TestCase):
+    def test_strips_only_a_trailing_version(self):
+        self.assertEqual('2401.01234', strip_arxiv_version('2401.01234v12'))
+        self.assertEqual('math/0501001', strip_arxiv_version('math/0501001v2'))
+        self.assertEqual('solv-int/9901001', strip_arxiv_version('solv-int/9901001'))
+        self.assertEqual('2401.01234v', strip_arxiv_version('2401.01234v'))
+
+
+class CaptureStdoutTests(unittest.TestCase):
+    def test_overlapping_captures_stay_per_thread(self):
+        original = sys.stdout
+        background, foreground = io.StringIO(), io.StringIO()
+        started, release = threading.Event(), threading.Event()
+
+        def job():
+            with capture_stdout(background):
+                print('job')
+                started.set()
+                release.wait(5)
+                print('job done')
+
+        thread = threading.Thread(target=job)
+        thread.start()
+        started.wait(5)
+        with capture_stdout(foreground):
+            print('request')
+            release.set()
+            thread.join(5)
+
+        self.assertEqual('job\njob done\n', background.getvalue())
+        self.assertEqual('request\n', foreground.getvalue())
+        # Outside any capture, writes reach the original stream again
+        self.assertIs(original, sys.stdout._target())
+
+
+if __name__ == '__main__':
+    unittest.main()